@@ -1,6 +1,8 @@
 # ABOUTME: Pydantic settings for application configuration.
 # ABOUTME: Extends DynagentSettings with app-level settings (OAuth, app name, port, etc.).
 
+from functools import lru_cache
+
 from autobots_devtools_shared_lib.dynagent import DynagentSettings, set_dynagent_settings
 from pydantic import Field
 
@@ -28,11 +30,24 @@ class AppSettings(DynagentSettings):
         )
 
 
+@lru_cache(maxsize=1)
 def get_app_settings() -> AppSettings:
-    """Get application settings instance."""
+    """Get the application settings instance.
+
+    Cached so repeated calls reuse one instance instead of re-parsing
+    environment variables and re-running pydantic validation each time.
+    """
     return AppSettings()
 
 
+def _reset_app_settings() -> None:
+    """Clear the cached settings instance so the next call re-reads the env.
+
+    Intended for tests that mutate settings-related environment variables.
+    """
+    get_app_settings.cache_clear()
+
+
 def init_app_settings(settings: AppSettings | None = None) -> AppSettings:
     """Initialize app settings and register with shared-lib so dynagent uses this instance.
 
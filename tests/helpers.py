@@ -2,9 +2,18 @@
 
 from collections.abc import Generator
 
+# Tracks whether Concierge tools have been registered in this test run, so the
+# register/reset cycle is paid once instead of once per test using the fixture.
+_registered = False
 
-def concierge_tools_registered() -> Generator[None, None, None]:
-    """Register Concierge tools for testing; reset after use.
+
+def concierge_tools_registered(*, isolated: bool = False) -> Generator[None, None, None]:
+    """Ensure Concierge tools are registered for a test.
+
+    Registration happens lazily on first use and is reused by every later
+    test, since the tests only read the registry. Pass isolated=True for a
+    test that mutates the registry: it gets a fresh registration and a full
+    reset afterwards.
 
     Usage in conftest.py:
         from tests.helpers import concierge_tools_registered
@@ -20,9 +29,14 @@ def concierge_tools_registered() -> Generator[None, None, None]:
 
     from autobots_agents_jarvis.domains.concierge.tools import register_concierge_tools
 
-    _reset_usecase_tools()
-    AgentMeta.reset()
-    register_concierge_tools()
+    global _registered
+    if isolated or not _registered:
+        _reset_usecase_tools()
+        AgentMeta.reset()
+        register_concierge_tools()
+        _registered = True
     yield
-    _reset_usecase_tools()
-    AgentMeta.reset()
+    if isolated:
+        _reset_usecase_tools()
+        AgentMeta.reset()
+        _registered = False
@@ -6,5 +6,9 @@ from tests.helpers import concierge_tools_registered
 
 @pytest.fixture
 def concierge_registered():
-    """Register Concierge tools; reset after test."""
+    """Ensure Concierge tools are registered (once per run, no per-test reset).
+
+    Registration is reused across tests; pass isolated=True to the helper
+    for a test that mutates the registry and needs a fresh register + reset.
+    """
     yield from concierge_tools_registered()